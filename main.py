@@ -2,20 +2,22 @@
 import os
 import sys
 import time
+import socket
 import logging
-import argparse
-import psutil
+import shutil
+import tempfile
+import functools
+import threading
 from pathlib import Path
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING
+from urllib.parse import urlparse
 
 # - third-party -
-from win32com import client
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, SessionNotCreatedException
+# third-party modules are imported where they're used so `--help` and the
+# already running/connected paths don't pay for them
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 # - logging -
 logging.basicConfig(level=logging.INFO)
@@ -23,48 +25,268 @@ logger = logging.getLogger("mudfish-auto")
 
 # - mudfish defaults -
 DEFAULT_MUDFISH_EXE_PATH = "C:/Program Files (x86)/Mudfish Cloud VPN/mudrun.exe"
+MUDFISH_UNINSTALL_KEYS = (
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\Mudfish Cloud VPN",
+    r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall\Mudfish Cloud VPN",
+)
 
 DEFAULT_MUDFISH_DESKTOP_URL = "http://127.0.0.1:8282/signin.html"
 DEFAULT_MUDFISH_ROUTER_URL = "http://192.168.1.1:8282"
 
-MUDFISH_STOP_BUTTON_ID = (By.ID, "mudwd-vpn-stop-btn")
-MUDFISH_START_BUTTON_ID = (By.ID, "mudwd-vpn-start-btn")
+# - chrome driver defaults -
+AUTO_MUDFISH_DATA_DIR = Path(os.environ.get("LOCALAPPDATA", tempfile.gettempdir()), "auto-mudfish")
+CHROME_DRIVER_CACHE_DIR = AUTO_MUDFISH_DATA_DIR.joinpath("chromedriver")
+CHROME_PROFILE_DIR = AUTO_MUDFISH_DATA_DIR.joinpath("chrome-profile")
+
+# skip the chrome subsystems the admin page doesn't need to speed up startup
+CHROME_ARGUMENTS = (
+    "headless",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-client-side-phishing-detection",
+    "--disable-breakpad",
+    "--disable-hang-monitor",
+    "--metrics-recording-only",
+    "--safebrowsing-disable-auto-update",
+    "--no-first-run",
+    "--mute-audio",
+    # don't download images, the login form doesn't need them
+    "--blink-settings=imagesEnabled=false",
+)
+
+# requests blocked before they leave chrome, images are already turned off
+# above, scripts and styles are kept since the connection buttons rely on
+# them to show/hide
+CHROME_BLOCKED_URLS = (
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.mp4",
+)
+
+MUDFISH_STOP_BUTTON_ID = "mudwd-vpn-stop-btn"
+MUDFISH_START_BUTTON_ID = "mudwd-vpn-start-btn"
+
+# fills in and submits the login form in a single WebDriver round-trip, the
+# form is left untouched if any part of it is missing so the fallback can fill it
+MUDFISH_LOGIN_SCRIPT = (
+    "var username = document.getElementById('username');"
+    "var password = document.getElementById('password');"
+    "var button = document.getElementsByClassName('btn')[0];"
+    "if (!username || !password || !button) { throw new Error('login form not found'); }"
+    "username.value = arguments[0];"
+    "password.value = arguments[1];"
+    "button.click();"
+)
+
+# seconds to wait for the login form to show up once the admin page is loaded
+MUDFISH_LOGIN_TIMEOUT = 4
+
+# seconds to wait for the connection buttons, this covers the navigation after
+# logging in and the admin page may be a router rather than this machine
+MUDFISH_STATUS_TIMEOUT = 4
+
+# session errors that mean chrome couldn't start with the persistent profile,
+# e.g. because a chrome left behind by an earlier run still owns it
+CHROME_PROFILE_ERRORS = (
+    "user data directory is already in use",
+    "DevToolsActivePort",
+    "Chrome failed to start",
+)
+
+# lock held for the lifetime of the process while it owns the chrome profile
+_chrome_profile_lock = None
+
+
+@functools.lru_cache(maxsize=None)
+def get_chrome_profile_dir() -> Optional[str]:
+    """
+    Get a persistent Chrome profile so Chrome's caches stay warm between runs.
+    :return: Path to the Chrome profile, None if another run is already using it
+    """
+    import msvcrt
+    global _chrome_profile_lock
+
+    CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    lock_file = open(AUTO_MUDFISH_DATA_DIR.joinpath("chrome-profile.lock"), "a")
+    try:
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        logger.debug("Chrome profile is in use, falling back to a temporary profile.")
+        return None
+
+    _chrome_profile_lock = lock_file
+    return CHROME_PROFILE_DIR.as_posix()
+
+
+def get_chrome_options(use_profile: Optional[bool] = True):
+    from selenium import webdriver
+
+    chrome_options = webdriver.ChromeOptions()
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
+
+    # hand control back once the DOM is ready instead of waiting for every resource
+    chrome_options.page_load_strategy = "eager"
+
+    # reuse the same profile between runs, chrome makes a temporary one otherwise
+    chrome_profile_dir = get_chrome_profile_dir() if use_profile else None
+    if chrome_profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={chrome_profile_dir}")
+        chrome_options.add_argument("--profile-directory=Default")
+    return chrome_options
+
 
-chrome_options = webdriver.ChromeOptions()
-chrome_options.add_argument("headless")
+@functools.lru_cache(maxsize=None)
+def get_chrome_major_version() -> Optional[str]:
+    """
+    Get the major version of the installed Google Chrome from the registry.
+    :return: The Chrome major version, None if Chrome could not be found
+    """
+    import winreg
+
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0].split(".")[0]
+        except OSError:
+            continue
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_cached_chrome_driver_path() -> Optional[str]:
+    """
+    Get the cached Chrome Driver matching the installed Chrome version.
+    :return: Path to the cached ``chromedriver.exe``, None if nothing is cached
+    """
+    chrome_major_version = get_chrome_major_version()
+    if not chrome_major_version:
+        return None
+
+    cache_dir = CHROME_DRIVER_CACHE_DIR.joinpath(chrome_major_version)
+    cached_driver = next(cache_dir.rglob("chromedriver.exe"), None)
+    return cached_driver.as_posix() if cached_driver else None
 
 
 def get_chrome_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+
+    # prefer the cached chrome driver, then one on the PATH, otherwise let
+    # selenium manager download the matching one
+    chrome_driver_path = get_cached_chrome_driver_path() or shutil.which("chromedriver")
+    service_kwargs = {}
+    if chrome_driver_path:
+        logger.debug("Using Chrome Driver '%s'", chrome_driver_path)
+        service_kwargs["executable_path"] = chrome_driver_path
+
     try:
-        return webdriver.Chrome(options=chrome_options)
-    except SessionNotCreatedException:
+        service = Service(**service_kwargs)
+        chrome_driver = webdriver.Chrome(options=get_chrome_options(), service=service)
+    except SessionNotCreatedException as exception:
+        # any other failure, e.g. a driver for another chrome version, won't
+        # be fixed by starting chrome again
+        profile_error = any(error in str(exception) for error in CHROME_PROFILE_ERRORS)
+        if not profile_error or not get_chrome_profile_dir():
+            logger.warning("No Chrome Driver found!")
+            return None
+
+        # a chrome left behind by an earlier run can still own the persistent
+        # profile, a new chrome then hands off to it and exits, so retry once
+        # with a temporary profile before treating the driver as missing
+        logger.warning("Could not start Chrome with the persistent profile, retrying without it...")
+        try:
+            service = Service(**service_kwargs)
+            chrome_driver = webdriver.Chrome(options=get_chrome_options(use_profile=False), service=service)
+        except WebDriverException:
+            logger.warning("No Chrome Driver found!")
+            return None
+    except WebDriverException:
+        # selenium manager couldn't resolve a driver either
         logger.warning("No Chrome Driver found!")
         return None
 
+    # don't fetch anything the admin page doesn't need, the page still works
+    # without the blocklist so carry on if chrome refuses it
+    try:
+        chrome_driver.execute_cdp_cmd("Network.enable", {})
+        chrome_driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(CHROME_BLOCKED_URLS)})
+    except WebDriverException:
+        logger.warning("Could not block unneeded requests, continuing without the blocklist.")
+    return chrome_driver
+
 
 def install_chrome_driver():
+    import zipfile
+    import requests
     from get_chrome_driver import GetChromeDriver
 
-    # install the chrome driver
-    chrome_driver = GetChromeDriver()
-    chrome_driver.install()
+    chrome_major_version = get_chrome_major_version()
+    try:
+        if chrome_major_version:
+            # download the chrome driver into the cache so later runs skip the download
+            cache_dir = CHROME_DRIVER_CACHE_DIR.joinpath(chrome_major_version)
+            GetChromeDriver().auto_download(output_path=cache_dir.as_posix(), extract=True)
+        else:
+            # without a known chrome version there is nothing to key the cache on
+            GetChromeDriver().install()
+    except (requests.RequestException, OSError, zipfile.BadZipFile):
+        logger.exception("An error occurred while trying to install the Chrome Driver:")
+        return None
 
     # return a new instance to use later
-    return webdriver.Chrome(options=chrome_options)
+    get_cached_chrome_driver_path.cache_clear()
+    chrome_driver = get_chrome_driver()
+
+    # clear out drivers for other chrome versions without holding up the login,
+    # only once the new driver is running so the two never race
+    threading.Thread(target=cleanup_old_chrome_drivers, daemon=True).start()
+    return chrome_driver
+
+
+def cleanup_old_chrome_drivers(keep: Optional[int] = 3) -> None:
+    """
+    Delete the cached Chrome Drivers of all but the newest Chrome versions, the
+    Chrome Driver of the installed Chrome is always kept.
+    :param keep: Number of other Chrome versions to keep Chrome Drivers for (default is 3).
+    """
+    if not CHROME_DRIVER_CACHE_DIR.is_dir():
+        return
+
+    # the cache is keyed by chrome major version, anything else is left alone
+    # along with the installed chrome's driver, which may not be the newest
+    chrome_major_version = get_chrome_major_version()
+    version_dirs = [
+        d for d in CHROME_DRIVER_CACHE_DIR.iterdir()
+        if d.is_dir() and d.name.isdigit() and d.name != chrome_major_version
+    ]
+    version_dirs.sort(key=lambda d: int(d.name), reverse=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        executor.map(functools.partial(shutil.rmtree, ignore_errors=True), version_dirs[keep:])
 
 
 def prompt_install_chrome_driver():
     import tkinter
+    from tkinter import messagebox
 
     # create root window instance and hide it
     root = tkinter.Tk()
     root.withdraw()
 
+    # NOTE: only called once `get_chrome_driver` failed, so there's no point in
+    # spinning up another chrome session before asking to install the driver
     try:
-        return webdriver.Chrome(options=chrome_options)
-    except SessionNotCreatedException:
-        from tkinter import messagebox
-
         install_missing_chrome_driver = messagebox.askyesnocancel(
             title="Chrome Driver Missing!",
             message=(
@@ -90,8 +312,98 @@ def is_mudfish_running() -> bool:
     Check if Mudfish is running.
     :return: True if Mudfish is running, False otherwise
     """
-    # loop through available processes to find the `mudrun` process
-    return "mudrun.exe" in (p.name() for p in psutil.process_iter())
+    import psutil
+
+    # loop through available processes to find the `mudrun` process, only the
+    # name is fetched and processes that vanish or deny access are skipped
+    return any(p.info["name"] == "mudrun.exe" for p in psutil.process_iter(["name"]))
+
+
+@functools.lru_cache(maxsize=None)
+def get_mudfish_launcher_lnks() -> tuple:
+    """
+    Get the Mudfish Launcher shortcut locations in the user's and the shared Start Menu.
+    :return: Paths to the shortcuts, in order of preference (they may not exist)
+    """
+    app_data = os.environ.get("APPDATA")
+    if app_data:
+        user_programs = Path(app_data, "Microsoft", "Windows", "Start Menu", "Programs")
+    else:
+        # only ask the shell for the Start Menu when the environment can't tell us
+        from win32com import client
+
+        shell_app = client.Dispatch("Shell.Application")
+        user_programs = Path(shell_app.namespace(2).self.path)
+
+    common_programs = Path(
+        os.environ.get("ProgramData", "C:/ProgramData"),
+        "Microsoft", "Windows", "Start Menu", "Programs"
+    )
+
+    # converts to forward slashes
+    return tuple(
+        programs.joinpath("Mudfish Cloud VPN", "Mudfish Launcher.lnk").as_posix()
+        for programs in (user_programs, common_programs)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_mudfish_install_dir() -> Optional[str]:
+    """
+    Get the Mudfish installation directory recorded by its installer in the registry.
+    :return: The installation directory, None if it could not be found
+    """
+    import winreg
+
+    for uninstall_key in MUDFISH_UNINSTALL_KEYS:
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, uninstall_key) as key:
+                install_dir = winreg.QueryValueEx(key, "InstallLocation")[0]
+        except OSError:
+            continue
+
+        if install_dir:
+            return Path(install_dir).as_posix()
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_mudfish_launcher_locations() -> tuple:
+    """
+    Get every location the Mudfish Launcher may be found at, built once per run.
+    :return: The Start Menu shortcuts, then the installed and the default executable
+    """
+    install_dir = get_mudfish_install_dir()
+    installed_exe = (f"{install_dir}/mudrun.exe",) if install_dir else ()
+    return get_mudfish_launcher_lnks() + installed_exe + (DEFAULT_MUDFISH_EXE_PATH,)
+
+
+def find_mudfish_launcher(launcher: Optional[str] = None) -> Optional[str]:
+    """
+    Find the Mudfish Launcher, checking the Start Menu shortcuts before the installed executable.
+    :param launcher: Optional path to the Mudfish Launcher executable, the only location checked if given.
+    :return: Path to the Mudfish Launcher, None if it could not be found
+    """
+    # NOTE: The mudfish documentation mentions a http 500 error which can be
+    # resolved by using a -S with the exe, however this requires firewall and
+    # permission updates, using the `lnk` shortcut in the Start Menu seems to be
+    # the most reliable way of launching Mudfish successfully via commandline
+    locations = (launcher,) if launcher else get_mudfish_launcher_locations()
+
+    # a single stat per location, returning the first regular file found so
+    # a directory sharing the name is never handed to os.startfile
+    for location in locations:
+        if os.path.isfile(location):
+            return location
+
+    locations_checked = "\n- ".join(locations)
+    logger.error(
+        f"Could not find Mudfish Launcher!\n"
+        f"Locations checked:\n"
+        f"- {locations_checked}\n"
+    )
+    return None
 
 
 def ensure_mudfish_is_running(
@@ -113,48 +425,63 @@ def ensure_mudfish_is_running(
     # otherwise attempt to find and run the Mudfish Launcher
     logger.info("Finding Mudfish Launcher...")
 
-    # NOTE: The mudfish documentation mentions a http 500 error which can be
-    # resolved by using a -S with the exe, however this requires firewall and
-    # permission updates, using the `lnk` shortcut in the Start Menu seems to be
-    # the most reliable way of launching Mudfish successfully via commandline
-    shell_app = client.Dispatch("Shell.Application")
-    mudfish_lnk = Path(shell_app.namespace(2).self.path).joinpath(
-        "Mudfish Cloud VPN",
-        "Mudfish Launcher.lnk"
-    ).as_posix()  # converts to forward slashes
-
-    launcher = launcher or mudfish_lnk if os.path.exists(mudfish_lnk) else DEFAULT_MUDFISH_EXE_PATH
-    if not os.path.exists(launcher):
-        locations = [mudfish_lnk, DEFAULT_MUDFISH_EXE_PATH]
-        locations_checked = "\n- ".join(locations)
-        logger.error(
-            f"Could not find Mudfish Launcher!\n"
-            f"Locations checked:\n"
-            f"- {locations_checked}\n"
-        )
+    launcher = find_mudfish_launcher(launcher)
+    if not launcher:
         return False
 
     # start the mudfish launcher
     os.startfile(launcher)
 
-    # check if mudfish is running every second for up to 10 seconds
-    for _ in range(polling_range):
-        time.sleep(1)  # Wait a second between each attempt
+    # check if mudfish is running for up to 10 seconds, starting with quick
+    # checks and backing off to one check a second
+    delay = 0.05
+    deadline = time.monotonic() + polling_range
+    while time.monotonic() < deadline:
+        time.sleep(delay)
         if is_mudfish_running():
 
             logger.info("Mudfish is now running!")
             return True
 
+        delay = min(delay * 2, 1.0)
+
     # log and return false if the mudfish process was not found running after 10 seconds
     logger.error("Could not start Mudfish!")
     return False
 
 
+def wait_for_admin_page(adminpage: str, timeout: Optional[float] = 5.0) -> bool:
+    """
+    Wait for the Mudfish admin page to accept connections.
+    :param adminpage: The Admin Page url to the Mudfish login page
+    :param timeout: Seconds to keep retrying before giving up (default is 5 seconds).
+    :return: True if the admin page is reachable, False otherwise
+    """
+    url = urlparse(adminpage)
+    default_port = 443 if url.scheme == "https" else 80
+    address = (url.hostname, url.port or default_port)
+
+    # the launcher opens its port shortly after the process shows up, so retry
+    # with a short exponential backoff since the admin page is usually local
+    delay = 0.25
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(address, timeout=1.0):
+                return True
+        except OSError:
+            if time.monotonic() + delay > deadline:
+                return False
+
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+
+
 def login_and_connect_to_mudfish(
         username: str,
         password: str,
         adminpage: str,
-        chrome_driver: Optional[webdriver.Chrome] = None
+        chrome_driver: Optional["webdriver.Chrome"] = None
 ) -> None:
     """
     Connect to Mudfish using Selenium WebDriver.
@@ -163,34 +490,53 @@ def login_and_connect_to_mudfish(
     :param adminpage: The Admin Page url to the Mudfish login page
     :param chrome_driver: Chrome ``webdriver`` instance (new instance if None is given).
     """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.wait import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import WebDriverException, JavascriptException
+
     try:
-        chrome_driver = chrome_driver or webdriver.Chrome(options=chrome_options)
+        chrome_driver = chrome_driver or get_chrome_driver()
+        if not chrome_driver:
+            logger.warning("Chrome Driver is needed to continue, aborting!")
+            return
 
         logger.info("Logging into Mudfish host...")
+
+        # the chrome profile is persistent, so always start from a logged out session
+        chrome_driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
         chrome_driver.get(adminpage)
-        chrome_driver.find_element(By.ID, "username").send_keys(username)
-        chrome_driver.find_element(By.ID, "password").send_keys(password)
-        chrome_driver.find_element(By.CLASS_NAME, "btn").click()
+        try:
+            chrome_driver.execute_script(MUDFISH_LOGIN_SCRIPT, username, password)
+        except JavascriptException:
+            # fall back to filling in the form field by field, once it shows up
+            username_condition = EC.presence_of_element_located((By.ID, "username"))
+            WebDriverWait(chrome_driver, MUDFISH_LOGIN_TIMEOUT).until(username_condition).send_keys(username)
+            chrome_driver.find_element(By.ID, "password").send_keys(password)
+            chrome_driver.find_element(By.CLASS_NAME, "btn").click()
         logger.info("Successfully logged into Mudfish")
 
         logger.info("Checking Connection status...")
         try:
-            # if the stop button is available then Mudfish is already connected
-            stop_condition = EC.presence_of_element_located(MUDFISH_STOP_BUTTON_ID)
-            WebDriverWait(chrome_driver, 4).until(stop_condition)
-
-            logger.info("Mudfish is already connected!")
-        except TimeoutException:
-            logger.info("Attempting to connect Mudfish VPN...")
+            # wait once for whichever button shows up first, the stop button
+            # means Mudfish is already connected, the start button means it isn't
+            status_condition = EC.any_of(
+                EC.presence_of_element_located((By.ID, MUDFISH_STOP_BUTTON_ID)),
+                EC.presence_of_element_located((By.ID, MUDFISH_START_BUTTON_ID))
+            )
+            status_button = WebDriverWait(chrome_driver, MUDFISH_STATUS_TIMEOUT).until(status_condition)
 
-            # wait for the start button to show
-            start_condition = EC.presence_of_element_located(MUDFISH_START_BUTTON_ID)
-            connect_button = WebDriverWait(chrome_driver, 4).until(start_condition)
+            if status_button.get_attribute("id") == MUDFISH_STOP_BUTTON_ID:
+                logger.info("Mudfish is already connected!")
 
             # click the start button if available
-            if connect_button.is_displayed():
-                connect_button.click()
+            elif status_button.is_displayed():
+                logger.info("Attempting to connect Mudfish VPN...")
+                status_button.click()
                 logger.info("Mudfish is now connected!")
+
+            else:
+                logger.warning("Mudfish connect button is not visible, could not connect!")
         finally:
             chrome_driver.quit()  # ensure the chrome driver is terminated
     except WebDriverException:
@@ -211,20 +557,40 @@ def main(
     :param launcher: Optional path to the Mudfish Launcher.
     """
 
+    # start chrome in the background while mudfish is launched, the launcher
+    # stays on the main thread since it dispatches COM objects
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        chrome_driver_future = executor.submit(get_chrome_driver)
+        try:
+            mudfish_is_running = ensure_mudfish_is_running(launcher=launcher)
+        except BaseException:
+            # don't leave the background chrome session holding on to its profile
+            chrome_driver = chrome_driver_future.result()
+            if chrome_driver:
+                chrome_driver.quit()  # ensure the unused chrome driver is terminated
+            raise
+
+        chrome_driver = chrome_driver_future.result()
+
     # early return if mudfish could not be ran successfully
-    if not ensure_mudfish_is_running(launcher=launcher):
+    if not mudfish_is_running:
         logger.error("Mudfish is not running and could not be ran. Aborting!")
+        if chrome_driver:
+            chrome_driver.quit()  # ensure the unused chrome driver is terminated
         return
 
-    # ensure the chrome driver is installed
-    chrome_driver = get_chrome_driver()
-
     # early return if no chrome driver was found/installed
     chrome_driver = chrome_driver or prompt_install_chrome_driver()
     if not chrome_driver:
         logger.warning("Chrome Driver is needed to continue, aborting!")
         return
 
+    # early return if the admin page never came up
+    if not wait_for_admin_page(adminpage):
+        logger.error(f"Could not reach the Mudfish admin page at '{adminpage}'. Aborting!")
+        chrome_driver.quit()  # ensure the unused chrome driver is terminated
+        return
+
     # login and connect to mudfish
     login_and_connect_to_mudfish(
         username,
@@ -234,7 +600,12 @@ def main(
     )
 
 
-if __name__ == "__main__":
+def cli() -> None:
+    """
+    Parse the commandline args and pass them on to ``main``.
+    """
+    import argparse
+
     # setup arg parser
     parser = argparse.ArgumentParser(description="Auto-connect Mudfish")
 
@@ -267,7 +638,11 @@ if __name__ == "__main__":
 
     # pass commandline args to the main method to start process
     main_kwargs = vars(parser.parse_args())
-    logger.debug(f"Parser Kwargs: '{main_kwargs}'")
+    logger.debug("Parser Kwargs: '%s'", main_kwargs)
     main(**main_kwargs)
 
-    sys.exit()
\ No newline at end of file
+    sys.exit()
+
+
+if __name__ == "__main__":
+    cli()
\ No newline at end of file